@@ -0,0 +1,53 @@
+"""Disk-backed TTL cache for slow AWS API responses."""
+
+import json
+import os
+import time
+from datetime import timedelta
+from typing import Any, Callable, Optional
+
+
+class FileCache:
+    """
+    A small JSON file cache with per-read TTL.
+
+    Each entry is stored as `<key>.json` containing a write timestamp and the
+    cached value. Any read or write failure falls back to behaving like a
+    cache miss, so callers never break when the cache directory is unusable.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.expanduser("~"), ".cache", "aws-finops"
+        )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str, ttl: timedelta) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+            if time.time() - entry["timestamp"] > ttl.total_seconds():
+                return None
+            return entry["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(key), "w") as f:
+                json.dump({"timestamp": time.time(), "value": value}, f)
+        except (OSError, TypeError):
+            pass
+
+    def get_or_set(self, key: str, fn: Callable[[], Any], ttl: timedelta) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key, ttl)
+        if value is None:
+            value = fn()
+            self.set(key, value)
+        return value
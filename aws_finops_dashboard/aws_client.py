@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import boto3
 from boto3.session import Session
@@ -10,6 +10,28 @@ from aws_finops_dashboard.types import EC2Summary, RegionName
 console = Console()
 
 
+# boto3 clients are untyped, so Any is the best available return type
+def get_client(session: Session, service: str, region_name: Optional[str] = None) -> Any:
+    """
+    Get a boto3 client for a service, cached on the session.
+
+    Client construction loads service models and endpoint resolvers, which is
+    expensive to repeat for every call across N profiles. Clients are
+    thread-safe for the read APIs used here, so reuse is safe.
+    """
+    cache = getattr(session, "_client_cache", None)
+    if cache is None:
+        cache = {}
+        session._client_cache = cache
+
+    key = (service, region_name)
+    client = cache.get(key)
+    if client is None:
+        client = session.client(service, region_name=region_name)
+        cache[key] = client
+    return client
+
+
 def get_aws_profiles() -> List[str]:
     """Get all configured AWS profiles from the AWS CLI configuration."""
     try:
@@ -23,7 +45,7 @@ def get_aws_profiles() -> List[str]:
 def get_account_id(session: Session) -> Optional[str]:
     """Get the AWS account ID for a session."""
     try:
-        account_id = session.client("sts").get_caller_identity().get("Account")
+        account_id = get_client(session, "sts").get_caller_identity().get("Account")
         return str(account_id) if account_id is not None else None
     except Exception as e:
         console.log(f"[yellow]Warning: Could not get account ID: {str(e)}[/]")
@@ -38,7 +60,7 @@ def get_all_regions(session: Session) -> List[RegionName]:
     If the call fails, it will return a hardcoded list of common regions.
     """
     try:
-        ec2_client = session.client("ec2", region_name="us-east-1")
+        ec2_client = get_client(session, "ec2", region_name="us-east-1")
         regions = [
             region["RegionName"] for region in ec2_client.describe_regions()["Regions"]
         ]
@@ -65,7 +87,7 @@ def get_accessible_regions(session: Session) -> List[RegionName]:
 
     for region in all_regions:
         try:
-            ec2_client = session.client("ec2", region_name=region)
+            ec2_client = get_client(session, "ec2", region_name=region)
             ec2_client.describe_instances(MaxResults=5)
             accessible_regions.append(region)
         except Exception:
@@ -101,7 +123,7 @@ def ec2_summary(
 
     for region in regions:
         try:
-            ec2_regional = session.client("ec2", region_name=region)
+            ec2_regional = get_client(session, "ec2", region_name=region)
             instances = ec2_regional.describe_instances()
             for reservation in instances["Reservations"]:
                 for instance in reservation["Instances"]:
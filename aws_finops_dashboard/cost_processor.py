@@ -1,21 +1,104 @@
+import atexit
 import csv
+import functools
+import hashlib
+import io
+import itertools
 import json
+import math
+import operator
 import os
-from datetime import date, datetime, timedelta
-from typing import List, Optional, Tuple
-
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from boto3.session import Session
 from rich.console import Console
 
-from aws_finops_dashboard.aws_client import get_account_id
+from aws_finops_dashboard._cache import FileCache
+from aws_finops_dashboard.aws_client import get_account_id, get_client
 from aws_finops_dashboard.types import BudgetInfo, CostData, EC2Summary, ProfileData
 
-from collections import defaultdict
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 console = Console()
 
+# Shared executor for the independent Cost Explorer/Budgets calls made per
+# profile. Module-level so profile-level parallelism in callers composes
+# without spawning a new pool per invocation.
+_executor = ThreadPoolExecutor(max_workers=8)
+
+# Separate small pool for report writes, so formatting and file I/O overlap
+# with rendering and later fetches instead of blocking the caller.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+atexit.register(_IO_EXECUTOR.shutdown)
+
+# Budgets fetched in this process, keyed by account ID. Budgets change slowly
+# and several profiles often share an account, so one round-trip per account
+# per run is enough.
+_budgets_by_account: Dict[Optional[str], List[Dict[str, Any]]] = {}
+
+# Cost Explorer bills per request and dominates dashboard latency, so cache
+# responses on disk. Windows still in progress get a short TTL; windows that
+# ended before today are immutable and can be kept much longer.
+_cost_cache = FileCache()
+_OPEN_WINDOW_TTL = timedelta(hours=6)
+_CLOSED_WINDOW_TTL = timedelta(days=30)
+
+# Bound format methods for CSV cell lines; with itertools.starmap these avoid
+# re-parsing an f-string per row element.
+_COST_LINE = "{}: ${:.2f}".format
+_COUNT_LINE = "{}: {}".format
+
+# C-level sort key for (name, cost) tuples; cheaper than a Python lambda
+_ITEM1: Callable[[Tuple[str, float]], float] = operator.itemgetter(1)
+
+# Display colors for EC2 instance states; anything else renders bright_cyan
+_EC2_STATE_COLOR = {"running": "bright_green", "stopped": "bright_yellow"}
+
+
+def _cached_cost_and_usage(
+    ce: Any, account_id: Optional[str], **params: Any
+) -> Dict[str, Any]:
+    """Call ce.get_cost_and_usage through the disk cache."""
+    # Without an account ID the key would collide across profiles whose STS
+    # access is denied, serving one account's cached costs as another's.
+    # Skip the cache entirely in that case.
+    if account_id is None:
+        response: Dict[str, Any] = ce.get_cost_and_usage(**params)
+        return response
+
+    key = hashlib.md5(
+        json.dumps({"account_id": account_id, **params}, sort_keys=True).encode()
+    ).hexdigest()
+    end = date.fromisoformat(params["TimePeriod"]["End"])
+    ttl = _CLOSED_WINDOW_TTL if end < date.today() else _OPEN_WINDOW_TTL
+    cached: Dict[str, Any] = _cost_cache.get_or_set(
+        key, lambda: ce.get_cost_and_usage(**params), ttl
+    )
+    return cached
+
+
+def _describe_all_budgets(
+    budgets_client: Any, account_id: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Fetch every budget for an account, paginating past the ~100-item page."""
+    cached = _budgets_by_account.get(account_id)
+    if cached is not None:
+        return cached
+
+    budgets: List[Dict[str, Any]] = []
+    paginator = budgets_client.get_paginator("describe_budgets")
+    for page in paginator.paginate(AccountId=account_id):
+        budgets.extend(page.get("Budgets", []))
+
+    _budgets_by_account[account_id] = budgets
+    return budgets
+
 
 def get_cost_data(session: Session, time_range: Optional[int] = None) -> CostData:
     """
@@ -25,8 +108,8 @@ def get_cost_data(session: Session, time_range: Optional[int] = None) -> CostDat
         session: The boto3 session to use
         time_range: Optional time range in days for cost data (default: current month)
     """
-    ce = session.client("ce")
-    budgets = session.client("budgets", region_name="us-east-1")
+    ce = get_client(session, "ce")
+    budgets = get_client(session, "budgets", region_name="us-east-1")
     today = date.today()
 
     if time_range:
@@ -43,27 +126,54 @@ def get_cost_data(session: Session, time_range: Optional[int] = None) -> CostDat
         previous_period_end = start_date - timedelta(days=1)
         previous_period_start = previous_period_end.replace(day=1)
 
+    # Format each boundary date once; the ISO strings are reused across the
+    # TimePeriod dicts and the returned CostData
+    start_iso = start_date.isoformat()
+    end_iso = end_date.isoformat()
+    previous_start_iso = previous_period_start.isoformat()
+    previous_end_iso = previous_period_end.isoformat()
+
     account_id = get_account_id(session)
 
+    # The three Cost Explorer calls and the budgets call are independent, so
+    # dispatch them concurrently and block only on the slowest one.
+    this_period_future = _executor.submit(
+        _cached_cost_and_usage,
+        ce,
+        account_id,
+        TimePeriod={"Start": start_iso, "End": end_iso},
+        Granularity="MONTHLY",
+        Metrics=["UnblendedCost"],
+    )
+    previous_period_future = _executor.submit(
+        _cached_cost_and_usage,
+        ce,
+        account_id,
+        TimePeriod={"Start": previous_start_iso, "End": previous_end_iso},
+        Granularity="MONTHLY",
+        Metrics=["UnblendedCost"],
+    )
+    # MONTHLY granularity is enough here: we only need per-service totals, and
+    # monthly buckets shrink the response ~30x versus DAILY for day ranges.
+    cost_by_service_future = _executor.submit(
+        _cached_cost_and_usage,
+        ce,
+        account_id,
+        TimePeriod={"Start": start_iso, "End": end_iso},
+        Granularity="MONTHLY",
+        Metrics=["UnblendedCost"],
+        GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+    )
+    budgets_future = _executor.submit(_describe_all_budgets, budgets, account_id)
+
     try:
-        this_period = ce.get_cost_and_usage(
-            TimePeriod={"Start": start_date.isoformat(), "End": end_date.isoformat()},
-            Granularity="MONTHLY",
-            Metrics=["UnblendedCost"],
-        )
+        this_period = this_period_future.result()
     except Exception as e:
         console.log(f"[yellow]Error getting current period cost: {e}[/]")
         this_period = {"ResultsByTime": [{"Total": {"UnblendedCost": {"Amount": 0}}}]}
 
     try:
-        previous_period = ce.get_cost_and_usage(
-            TimePeriod={
-                "Start": previous_period_start.isoformat(),
-                "End": previous_period_end.isoformat(),
-            },
-            Granularity="MONTHLY",
-            Metrics=["UnblendedCost"],
-        )
+        previous_period = previous_period_future.result()
     except Exception as e:
         console.log(f"[yellow]Error getting previous period cost: {e}[/]")
         previous_period = {
@@ -71,42 +181,53 @@ def get_cost_data(session: Session, time_range: Optional[int] = None) -> CostDat
         }
 
     try:
-        current_period_cost_by_service = ce.get_cost_and_usage(
-            TimePeriod={"Start": start_date.isoformat(), "End": end_date.isoformat()},
-            Granularity="DAILY" if time_range else "MONTHLY",
-            Metrics=["UnblendedCost"],
-            GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
-        )
+        current_period_cost_by_service = cost_by_service_future.result()
     except Exception as e:
         console.log(f"[yellow]Error getting current period cost by service: {e}[/]")
         current_period_cost_by_service = {"ResultsByTime": [{"Groups": []}]}
 
-    # Aggregate cost by service across all days
-    aggregated_service_costs = defaultdict(float)
-
-    for result in current_period_cost_by_service.get("ResultsByTime", []):
-        for group in result.get("Groups", []):
-            service = group["Keys"][0]
-            amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-            aggregated_service_costs[service] += amount
-
-    # Reformat into groups by service
-    aggregated_groups = [
-        {
-            "Keys": [service],
-            "Metrics": {
-                "UnblendedCost": {
-                    "Amount": str(amount)
+    # Aggregate cost by service across buckets
+    results_by_time = current_period_cost_by_service.get("ResultsByTime", [])
+
+    if len(results_by_time) == 1:
+        # Single bucket: the groups are already per-service totals
+        aggregated_groups = results_by_time[0].get("Groups", [])
+        service_cost_totals = {
+            group["Keys"][0]: float(group["Metrics"]["UnblendedCost"]["Amount"])
+            for group in aggregated_groups
+        }
+    else:
+        aggregated_service_costs = defaultdict(float)
+
+        # Bind the accumulator locally so the hot loop avoids repeated
+        # global/attribute lookups per group
+        agg = aggregated_service_costs
+        for result in results_by_time:
+            groups = result.get("Groups")
+            if not groups:
+                continue
+            for group in groups:
+                agg[group["Keys"][0]] += float(
+                    group["Metrics"]["UnblendedCost"]["Amount"]
+                )
+
+        # Reformat into groups by service
+        aggregated_groups = [
+            {
+                "Keys": [service],
+                "Metrics": {
+                    "UnblendedCost": {
+                        "Amount": str(amount)
+                    }
                 }
             }
-        }
-        for service, amount in aggregated_service_costs.items()
-    ]
+            for service, amount in aggregated_service_costs.items()
+        ]
+        service_cost_totals = dict(aggregated_service_costs)
 
     budgets_data: List[BudgetInfo] = []
     try:
-        response = budgets.describe_budgets(AccountId=account_id)
-        for budget in response["Budgets"]:
+        for budget in budgets_future.result():
             budgets_data.append(
                 {
                     "name": budget["BudgetName"],
@@ -124,15 +245,17 @@ def get_cost_data(session: Session, time_range: Optional[int] = None) -> CostDat
         console.log(f"[yellow]Error getting budget data: {e}[/]")
         pass
 
-    current_period_cost = 0.0
-    for period in this_period.get("ResultsByTime", []):
-        if "Total" in period and "UnblendedCost" in period["Total"]:
-            current_period_cost += float(period["Total"]["UnblendedCost"]["Amount"])
+    current_period_cost = math.fsum(
+        float(period["Total"]["UnblendedCost"]["Amount"])
+        for period in this_period.get("ResultsByTime", ())
+        if "Total" in period and "UnblendedCost" in period["Total"]
+    )
 
-    previous_period_cost = 0.0
-    for period in previous_period.get("ResultsByTime", []):
-        if "Total" in period and "UnblendedCost" in period["Total"]:
-            previous_period_cost += float(period["Total"]["UnblendedCost"]["Amount"])
+    previous_period_cost = math.fsum(
+        float(period["Total"]["UnblendedCost"]["Amount"])
+        for period in previous_period.get("ResultsByTime", ())
+        if "Total" in period and "UnblendedCost" in period["Total"]
+    )
 
     current_period_name = (
         f"Current {time_range} days cost" if time_range else "Current month's cost"
@@ -144,14 +267,15 @@ def get_cost_data(session: Session, time_range: Optional[int] = None) -> CostDat
         "current_month": current_period_cost,
         "last_month": previous_period_cost,
         "current_month_cost_by_service": aggregated_groups,
+        "service_cost_totals": service_cost_totals,
         "budgets": budgets_data,
         "current_period_name": current_period_name,
         "previous_period_name": previous_period_name,
         "time_range": time_range,
-        "current_period_start": start_date.isoformat(),
-        "current_period_end": end_date.isoformat(),
-        "previous_period_start": previous_period_start.isoformat(),
-        "previous_period_end": previous_period_end.isoformat(),
+        "current_period_start": start_iso,
+        "current_period_end": end_iso,
+        "previous_period_start": previous_start_iso,
+        "previous_period_end": previous_end_iso,
     }
 
 
@@ -160,16 +284,14 @@ def process_service_costs(
 ) -> Tuple[List[str], List[Tuple[str, float]]]:
     """Process and format service costs from cost data."""
     service_costs: List[str] = []
-    service_cost_data: List[Tuple[str, float]] = []
 
-    for group in cost_data["current_month_cost_by_service"]:
-        if "Keys" in group and "Metrics" in group:
-            service_name = group["Keys"][0]
-            cost_amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-            if cost_amount > 0.001:
-                service_cost_data.append((service_name, cost_amount))
+    service_cost_data: List[Tuple[str, float]] = [
+        (service_name, cost_amount)
+        for service_name, cost_amount in cost_data["service_cost_totals"].items()
+        if cost_amount > 0.001
+    ]
 
-    service_cost_data.sort(key=lambda x: x[1], reverse=True)
+    service_cost_data.sort(key=_ITEM1, reverse=True)
 
     if not service_cost_data:
         service_costs.append("No costs associated with this account")
@@ -179,158 +301,169 @@ def process_service_costs(
 
     return service_costs, service_cost_data
 
+# Service to category mapping, built once at import so every call (and the
+# lowercase index derived below) reuses the same dict.
+_SERVICE_CATEGORIES: dict[str, str] = {
+    # Compute
+    "Amazon Elastic Compute Cloud": "Compute",
+    "EC2 - Other": "Compute",
+    "Amazon Elastic Container Service": "Compute",
+    "Amazon EKS": "Compute",
+    "AWS Lambda": "Compute",
+    "Amazon Elastic Container Registry": "Compute",
+    "AWS Fargate": "Compute",
+    "Amazon Lightsail": "Compute",
+    "EC2 Container Registry": "Compute",
+    "Amazon Elastic Kubernetes Service": "Compute",
+    "Amazon EC2 Container Service": "Compute",
+    
+    # Storage
+    "Amazon Simple Storage Service": "Storage",
+    "Amazon Elastic Block Store": "Storage",
+    "Amazon Elastic File System": "Storage",
+    "Amazon FSx": "Storage",
+    "Amazon S3 Glacier": "Storage",
+    "Storage Gateway": "Storage",
+    "AWS Backup": "Storage",
+    
+    # Database
+    "Amazon Relational Database Service": "Database",
+    "Amazon DynamoDB": "Database",
+    "Amazon ElastiCache": "Database",
+    "Amazon Redshift": "Database",
+    "Amazon Neptune": "Database",
+    "Amazon DocumentDB": "Database",
+    "Amazon Timestream": "Database",
+    "Amazon Quantum Ledger Database": "Database",
+    "Amazon Keyspaces": "Database",
+    "Amazon Aurora": "Database",
+    
+    # Networking & Content Delivery
+    "Amazon Virtual Private Cloud": "Networking",
+    "Amazon CloudFront": "Networking",
+    "Amazon Route 53": "Networking",
+    "Elastic Load Balancing": "Networking",
+    "AWS Direct Connect": "Networking",
+    "Amazon API Gateway": "Networking",
+    "Amazon VPC": "Networking",
+    "AWS Global Accelerator": "Networking",
+    "AWS Transit Gateway": "Networking",
+    
+    # Analytics
+    "Amazon Athena": "Analytics",
+    "Amazon EMR": "Analytics",
+    "Amazon Kinesis": "Analytics",
+    "Amazon Managed Streaming for Apache Kafka": "Analytics",
+    "Amazon OpenSearch Service": "Analytics",
+    "Amazon QuickSight": "Analytics",
+    "AWS Glue": "Analytics",
+    "Amazon Elasticsearch Service": "Analytics",
+    "Amazon Data Firehose": "Analytics",
+    
+    # Machine Learning
+    "Amazon SageMaker": "Machine Learning",
+    "Amazon Comprehend": "Machine Learning",
+    "Amazon Rekognition": "Machine Learning",
+    "Amazon Polly": "Machine Learning",
+    "Amazon Translate": "Machine Learning",
+    "Amazon Lex": "Machine Learning",
+    "Amazon Forecast": "Machine Learning",
+    "Amazon Textract": "Machine Learning",
+    
+    # Security & Identity
+    "AWS Key Management Service": "Security",
+    "AWS WAF": "Security",
+    "Amazon GuardDuty": "Security",
+    "AWS Shield": "Security",
+    "AWS Certificate Manager": "Security",
+    "AWS Secrets Manager": "Security",
+    "AWS Identity and Access Management": "Security",
+    "AWS IAM": "Security",
+    "Amazon Inspector": "Security",
+    "AWS Directory Service": "Security",
+    
+    # Management & Governance
+    "AWS CloudTrail": "Management",
+    "Amazon CloudWatch": "Management",
+    "AWS Config": "Management",
+    "AWS Systems Manager": "Management",
+    "AWS CloudFormation": "Management",
+    "AWS Organizations": "Management",
+    "AWS Control Tower": "Management",
+    "AWS Trusted Advisor": "Management",
+    "AWS Cost Explorer": "Management",
+    
+    # Developer Tools
+    "AWS CodeBuild": "Developer Tools",
+    "AWS CodeCommit": "Developer Tools",
+    "AWS CodeDeploy": "Developer Tools",
+    "AWS CodePipeline": "Developer Tools",
+    "AWS CodeStar": "Developer Tools",
+    "AWS X-Ray": "Developer Tools",
+    
+    # Application Integration
+    "Amazon Simple Queue Service": "Integration",
+    "Amazon Simple Notification Service": "Integration",
+    "Amazon MQ": "Integration",
+    "AWS Step Functions": "Integration",
+    "Amazon AppFlow": "Integration",
+    "Amazon EventBridge": "Integration",
+    
+    # Customer Engagement
+    "Amazon Connect": "Customer Engagement",
+    "Amazon Pinpoint": "Customer Engagement",
+    "Amazon Simple Email Service": "Customer Engagement",
+    
+    # Support & Billing
+    "AWS Support": "Support & Billing",
+    "AWS Billing": "Support & Billing",
+    "Tax": "Support & Billing"
+}
+
+# Casefolded bytes index for partial matching, derived once alongside the
+# mapping. Comparing as bytes lets the `in` operator use the C substring
+# search, which is faster than the str path for these ASCII names.
+_SERVICE_CATEGORIES_FOLDED: List[Tuple[bytes, str]] = [
+    (known_service.casefold().encode(), cat)
+    for known_service, cat in _SERVICE_CATEGORIES.items()
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _categorize_one(service_name: str) -> str:
+    """Resolve a single AWS service name to its category, memoized per name."""
+    # Try to find an exact match
+    category = _SERVICE_CATEGORIES.get(service_name, None)
+
+    # If no exact match, try partial match against the casefolded index
+    if category is None:
+        service_name_folded = service_name.casefold().encode()
+        for known_service_folded, cat in _SERVICE_CATEGORIES_FOLDED:
+            if known_service_folded in service_name_folded or service_name_folded in known_service_folded:
+                category = cat
+                break
+        else:
+            # If still no match, categorize as Other
+            category = "Other"
+
+    return category
+
+
 def categorize_aws_services(service_costs: List[Tuple[str, float]]) -> dict[str, float]:
     """
     Categorize AWS services into groups like compute, storage, networking, etc.
-    
+
     Args:
         service_costs: List of tuples containing (service_name, cost)
-        
+
     Returns:
         Dictionary mapping categories to their total costs
     """
-    # Define service to category mapping
-    service_categories = {
-        # Compute
-        "Amazon Elastic Compute Cloud": "Compute",
-        "EC2 - Other": "Compute",
-        "Amazon Elastic Container Service": "Compute",
-        "Amazon EKS": "Compute",
-        "AWS Lambda": "Compute",
-        "Amazon Elastic Container Registry": "Compute",
-        "AWS Fargate": "Compute",
-        "Amazon Lightsail": "Compute",
-        "EC2 Container Registry": "Compute",
-        "Amazon Elastic Kubernetes Service": "Compute",
-        "Amazon EC2 Container Service": "Compute",
-        
-        # Storage
-        "Amazon Simple Storage Service": "Storage",
-        "Amazon Elastic Block Store": "Storage",
-        "Amazon Elastic File System": "Storage",
-        "Amazon FSx": "Storage",
-        "Amazon S3 Glacier": "Storage",
-        "Storage Gateway": "Storage",
-        "AWS Backup": "Storage",
-        
-        # Database
-        "Amazon Relational Database Service": "Database",
-        "Amazon DynamoDB": "Database",
-        "Amazon ElastiCache": "Database",
-        "Amazon Redshift": "Database",
-        "Amazon Neptune": "Database",
-        "Amazon DocumentDB": "Database",
-        "Amazon Timestream": "Database",
-        "Amazon Quantum Ledger Database": "Database",
-        "Amazon Keyspaces": "Database",
-        "Amazon Aurora": "Database",
-        
-        # Networking & Content Delivery
-        "Amazon Virtual Private Cloud": "Networking",
-        "Amazon CloudFront": "Networking",
-        "Amazon Route 53": "Networking",
-        "Elastic Load Balancing": "Networking",
-        "AWS Direct Connect": "Networking",
-        "Amazon API Gateway": "Networking",
-        "Amazon VPC": "Networking",
-        "AWS Global Accelerator": "Networking",
-        "AWS Transit Gateway": "Networking",
-        
-        # Analytics
-        "Amazon Athena": "Analytics",
-        "Amazon EMR": "Analytics",
-        "Amazon Kinesis": "Analytics",
-        "Amazon Managed Streaming for Apache Kafka": "Analytics",
-        "Amazon OpenSearch Service": "Analytics",
-        "Amazon QuickSight": "Analytics",
-        "AWS Glue": "Analytics",
-        "Amazon Elasticsearch Service": "Analytics",
-        "Amazon Data Firehose": "Analytics",
-        
-        # Machine Learning
-        "Amazon SageMaker": "Machine Learning",
-        "Amazon Comprehend": "Machine Learning",
-        "Amazon Rekognition": "Machine Learning",
-        "Amazon Polly": "Machine Learning",
-        "Amazon Translate": "Machine Learning",
-        "Amazon Lex": "Machine Learning",
-        "Amazon Forecast": "Machine Learning",
-        "Amazon Textract": "Machine Learning",
-        
-        # Security & Identity
-        "AWS Key Management Service": "Security",
-        "AWS WAF": "Security",
-        "Amazon GuardDuty": "Security",
-        "AWS Shield": "Security",
-        "AWS Certificate Manager": "Security",
-        "AWS Secrets Manager": "Security",
-        "AWS Identity and Access Management": "Security",
-        "AWS IAM": "Security",
-        "Amazon Inspector": "Security",
-        "AWS Directory Service": "Security",
-        
-        # Management & Governance
-        "AWS CloudTrail": "Management",
-        "Amazon CloudWatch": "Management",
-        "AWS Config": "Management",
-        "AWS Systems Manager": "Management",
-        "AWS CloudFormation": "Management",
-        "AWS Organizations": "Management",
-        "AWS Control Tower": "Management",
-        "AWS Trusted Advisor": "Management",
-        "AWS Cost Explorer": "Management",
-        
-        # Developer Tools
-        "AWS CodeBuild": "Developer Tools",
-        "AWS CodeCommit": "Developer Tools",
-        "AWS CodeDeploy": "Developer Tools",
-        "AWS CodePipeline": "Developer Tools",
-        "AWS CodeStar": "Developer Tools",
-        "AWS X-Ray": "Developer Tools",
-        
-        # Application Integration
-        "Amazon Simple Queue Service": "Integration",
-        "Amazon Simple Notification Service": "Integration",
-        "Amazon MQ": "Integration",
-        "AWS Step Functions": "Integration",
-        "Amazon AppFlow": "Integration",
-        "Amazon EventBridge": "Integration",
-        
-        # Customer Engagement
-        "Amazon Connect": "Customer Engagement",
-        "Amazon Pinpoint": "Customer Engagement",
-        "Amazon Simple Email Service": "Customer Engagement",
-        
-        # Support & Billing
-        "AWS Support": "Support & Billing",
-        "AWS Billing": "Support & Billing",
-        "Tax": "Support & Billing"
-    }
-    
-    # Initialize category totals
     category_totals = defaultdict(float)
-    
-    # Process each service cost
+
     for service_name, cost in service_costs:
-        # Try to find an exact match
-        category = service_categories.get(service_name, None)
-        
-        # If no exact match, try partial match
-        if category is None:
-            matched = False
-            for known_service, cat in service_categories.items():
-                if known_service.lower() in service_name.lower() or service_name.lower() in known_service.lower():
-                    category = cat
-                    matched = True
-                    break
-            
-            # If still no match, categorize as Other
-            if not matched:
-                category = "Other"
-        
-        # Add cost to appropriate category
-        category_totals[category] += cost
-    
+        category_totals[_categorize_one(service_name)] += cost
+
     return category_totals
 
 
@@ -345,30 +478,21 @@ def format_budget_info(budgets: List[BudgetInfo]) -> List[str]:
 
 def format_ec2_summary(ec2_data: EC2Summary) -> List[str]:
     """Format EC2 instance summary for display."""
-    ec2_summary_text: List[str] = []
-    for state, count in sorted(ec2_data.items()):
-        if count > 0:
-            state_color = (
-                "bright_green"
-                if state == "running"
-                else "bright_yellow" if state == "stopped" else "bright_cyan"
-            )
-            ec2_summary_text.append(f"[{state_color}]{state}: {count}[/]")
-
-    if not ec2_summary_text:
-        ec2_summary_text = ["No instances found"]
-
-    return ec2_summary_text
+    return [
+        f"[{_EC2_STATE_COLOR.get(state, 'bright_cyan')}]{state}: {count}[/]"
+        for state, count in sorted(ec2_data.items())
+        if count > 0
+    ] or ["No instances found"]
 
 
-def export_to_csv(
-    data: List[ProfileData], 
-    filename: str, 
+def _export_to_csv(
+    data: List[ProfileData],
+    filename: str,
     output_dir: Optional[str] = None,
     previous_period_dates: str = "N/A",
     current_period_dates: str = "N/A",
 ) -> Optional[str]:
-    """Export dashboard data to a CSV file."""
+    """Write dashboard data to a CSV file (runs on the I/O executor)."""
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         base_filename = f"{filename}_{timestamp}.csv"
@@ -382,62 +506,63 @@ def export_to_csv(
         previous_period_header = f"Cost for period\n({previous_period_dates})"
         current_period_header = f"Cost for period\n({current_period_dates})" 
 
-        with open(output_filename, "w", newline="") as csvfile:
-            fieldnames = [
-                "CLI Profile",
-                "AWS Account ID",
-                previous_period_header,
-                current_period_header,
-                "Cost By Service",
-                "Cost By Category",  # Nova coluna
-                "Budget Status",
-                "EC2 Instances",
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in data:
-
-                services_data = "\n".join(
-                    [
-                        f"{service}: ${cost:.2f}"
-                        for service, cost in row["service_costs"]
-                    ]
-                )
-                
-                category_costs = categorize_aws_services(row["service_costs"])
-                categories_data = "\n".join(
-                    [
-                        f"{category}: ${cost:.2f}"
-                        for category, cost in sorted(category_costs.items(), key=lambda x: x[1], reverse=True)
-                    ]
-                )
+        # Assemble the whole report in memory and flush it with one binary
+        # write: one encode pass and one syscall instead of one per row
+        csvfile = io.StringIO()
+        fieldnames = [
+            "CLI Profile",
+            "AWS Account ID",
+            previous_period_header,
+            current_period_header,
+            "Cost By Service",
+            "Cost By Category",  # Nova coluna
+            "Budget Status",
+            "EC2 Instances",
+        ]
+        # Plain csv.writer with tuples in fieldnames order avoids the
+        # per-row fieldname lookup that DictWriter does
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        for row in data:
+
+            services_data = "\n".join(
+                itertools.starmap(_COST_LINE, row["service_costs"])
+            )
 
-                budgets_data = (
-                    "\n".join(row["budget_info"])
-                    if row["budget_info"]
-                    else "No budgets"
-                )
+            category_costs = categorize_aws_services(row["service_costs"])
+            sorted_categories = sorted(
+                category_costs.items(), key=_ITEM1, reverse=True
+            )
+            categories_data = "\n".join(
+                itertools.starmap(_COST_LINE, sorted_categories)
+            )
 
-                ec2_data_summary = "\n".join(
-                    [
-                        f"{state}: {count}"
-                        for state, count in row["ec2_summary"].items()
-                        if count > 0
-                    ]
-                )
+            budgets_data = (
+                "\n".join(row["budget_info"])
+                if row["budget_info"]
+                else "No budgets"
+            )
 
-                writer.writerow(
-                    {
-                        "CLI Profile": row["profile"],
-                        "AWS Account ID": row["account_id"],
-                        previous_period_header: f"${row['last_month']:.2f}",
-                        current_period_header: f"${row['current_month']:.2f}",
-                        "Cost By Service": services_data or "No costs",
-                        "Cost By Category": categories_data or "No costs",  # Nova coluna
-                        "Budget Status": budgets_data or "No budgets",
-                        "EC2 Instances": ec2_data_summary or "No instances",
-                    }
+            ec2_data_summary = "\n".join(
+                _COUNT_LINE(state, count)
+                for state, count in row["ec2_summary"].items()
+                if count > 0
+            )
+
+            writer.writerow(
+                (
+                    row["profile"],
+                    row["account_id"],
+                    f"${row['last_month']:.2f}",
+                    f"${row['current_month']:.2f}",
+                    services_data or "No costs",
+                    categories_data or "No costs",  # Nova coluna
+                    budgets_data or "No budgets",
+                    ec2_data_summary or "No instances",
                 )
+            )
+        with open(output_filename, "wb") as f:
+            f.write(csvfile.getvalue().encode("utf-8"))
         console.print(
             f"[bright_green]Exported dashboard data to {os.path.abspath(output_filename)}[/]"
         )
@@ -447,10 +572,10 @@ def export_to_csv(
         return None
 
 
-def export_to_json(
+def _export_to_json(
     data: List[ProfileData], filename: str, output_dir: Optional[str] = None
 ) -> Optional[str]:
-    """Export dashboard data to a JSON file."""
+    """Write dashboard data to a JSON file (runs on the I/O executor)."""
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         base_filename = f"{filename}_{timestamp}.json"
@@ -461,8 +586,18 @@ def export_to_json(
         else:
             output_filename = base_filename
 
-        with open(output_filename, "w") as jsonfile:
-            json.dump(data, jsonfile, indent=4)
+        if orjson is not None:
+            # orjson serializes to bytes in one shot, much faster than
+            # stdlib json on large multi-account exports
+            with open(output_filename, "wb") as jsonfile:
+                jsonfile.write(
+                    orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+        else:
+            with open(output_filename, "w") as jsonfile:
+                json.dump(data, jsonfile, indent=4)
 
         console.print(
             f"[bright_green]Exported dashboard data to {os.path.abspath(output_filename)}[/]"
@@ -471,3 +606,34 @@ def export_to_json(
     except Exception as e:
         console.print(f"[bold red]Error exporting to JSON: {str(e)}[/]")
         return None
+
+
+def export_to_csv(
+    data: List[ProfileData],
+    filename: str,
+    output_dir: Optional[str] = None,
+    previous_period_dates: str = "N/A",
+    current_period_dates: str = "N/A",
+) -> "Future[Optional[str]]":
+    """
+    Export dashboard data to a CSV file on a background thread.
+
+    Returns a future resolving to the absolute path of the written file, or
+    None on failure. The executor is drained at interpreter exit, so pending
+    exports always complete.
+    """
+    return _IO_EXECUTOR.submit(
+        _export_to_csv, data, filename, output_dir, previous_period_dates, current_period_dates
+    )
+
+
+def export_to_json(
+    data: List[ProfileData], filename: str, output_dir: Optional[str] = None
+) -> "Future[Optional[str]]":
+    """
+    Export dashboard data to a JSON file on a background thread.
+
+    Returns a future resolving to the absolute path of the written file, or
+    None on failure.
+    """
+    return _IO_EXECUTOR.submit(_export_to_json, data, filename, output_dir)
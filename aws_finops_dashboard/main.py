@@ -1,13 +1,14 @@
 import argparse
 import sys
 from collections import defaultdict
+from operator import itemgetter
 from typing import Dict, List, Optional
 
 import boto3
 from rich import box
 from rich.console import Console
 from rich.table import Column, Table
-from rich.progress import Progress, track
+from rich.progress import track
 from rich.status import Status
 
 from aws_finops_dashboard.aws_client import (
@@ -109,12 +110,9 @@ def process_combined_profiles(
         combined_current_month = account_cost_data["current_month"]
         combined_last_month = account_cost_data["last_month"]
         combined_service_costs = defaultdict(float)
-        for group in account_cost_data["current_month_cost_by_service"]:
-            if "Keys" in group and "Metrics" in group:
-                service_name = group["Keys"][0]
-                cost_amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-                if cost_amount > 0.001:
-                    combined_service_costs[service_name] += cost_amount
+        for service_name, cost_amount in account_cost_data["service_cost_totals"].items():
+            if cost_amount > 0.001:
+                combined_service_costs[service_name] += cost_amount
     except Exception as e:
         console.log(
             f"[bold red]Error getting cost data for account {account_id}: {str(e)}[/]"
@@ -135,7 +133,7 @@ def process_combined_profiles(
         for service, cost in combined_service_costs.items()
         if cost > 0.001
     ]
-    service_cost_data.sort(key=lambda x: x[1], reverse=True)
+    service_cost_data.sort(key=itemgetter(1), reverse=True)
 
     if not service_cost_data:
         service_costs.append("No costs associated with this account")
@@ -199,7 +197,7 @@ def add_profile_to_table(table: Table, profile_data: ProfileData) -> None:
     
         category_costs = categorize_aws_services(profile_data["service_costs"])
         category_formatted = [f"{category}: ${cost:.2f}" for category, cost in 
-                             sorted(category_costs.items(), key=lambda x: x[1], reverse=True)]
+                             sorted(category_costs.items(), key=itemgetter(1), reverse=True)]
         
         table.add_row(
             f"[bright_magenta]{profile_data['profile']}\nAccount: {profile_data['account_id']}[/]",
@@ -335,24 +333,27 @@ def run_dashboard(args: argparse.Namespace) -> int:
     console.print(table)
 
     if args.report_name and args.report_type:
+        # Dispatch all exports to the background pool, then collect results
+        export_futures = []
         for report_type in args.report_type:
             if report_type == "csv":
-                csv_path = export_to_csv(
-                    export_data, 
-                    args.report_name, 
+                csv_future = export_to_csv(
+                    export_data,
+                    args.report_name,
                     args.dir,
                     previous_period_dates=previous_period_dates,
                     current_period_dates=current_period_dates,)
-                if csv_path:
-                    console.print(
-                        f"[bright_green]Successfully exported to CSV format: {csv_path}[/]"
-                    )
+                export_futures.append(("CSV", csv_future))
             elif report_type == "json":
-                json_path = export_to_json(export_data, args.report_name, args.dir)
-                if json_path:
-                    console.print(
-                        f"[bright_green]Successfully exported to JSON format: {json_path}[/]"
-                    )
+                json_future = export_to_json(export_data, args.report_name, args.dir)
+                export_futures.append(("JSON", json_future))
+
+        for format_name, export_future in export_futures:
+            export_path = export_future.result()
+            if export_path:
+                console.print(
+                    f"[bright_green]Successfully exported to {format_name} format: {export_path}[/]"
+                )
 
     return 0
 
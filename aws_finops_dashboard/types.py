@@ -19,6 +19,7 @@ class CostData(TypedDict):
     current_month: float
     last_month: float
     current_month_cost_by_service: List[Dict]
+    service_cost_totals: Dict[str, float]
     budgets: List[BudgetInfo]
     current_period_name: str
     previous_period_name: str